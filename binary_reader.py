@@ -1,41 +1,64 @@
 #!/usr/bin/env python3
 
+import mmap
 import struct
-from typing import BinaryIO
+from typing import BinaryIO, Union
+
+# Precompiled little-endian primitives
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_I64 = struct.Struct("<q")
+_F32 = struct.Struct("<f")
 
 
 class BinReader:
     """Binary reader for parsing binary data with various data type support."""
 
-    def __init__(self, f: BinaryIO):
-        self.f = f
+    def __init__(self, data: Union[bytes, bytearray, memoryview, mmap.mmap, BinaryIO], off: int = 0):
+        """
+        Initialize the reader over an in-memory buffer.
 
-    def read(self, n: int) -> bytes:
-        """Read exactly n bytes from the stream."""
-        b = self.f.read(n)
-        if len(b) != n:
+        Args:
+            data: Buffer to parse; a binary stream is read fully into memory first
+            off: Offset to start reading at (default 0)
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview, mmap.mmap)):
+            data = data.read()
+        self.mv = memoryview(data)
+        self.off = off
+
+    def _advance(self, n: int) -> int:
+        """Move the cursor forward by n bytes and return its previous position."""
+        off = self.off
+        if off + n > len(self.mv):
             raise EOFError("unexpected EOF")
-        return b
+        self.off = off + n
+        return off
+
+    def read(self, n: int) -> bytes:
+        """Read exactly n bytes from the buffer."""
+        off = self._advance(n)
+        return bytes(self.mv[off:off + n])
 
     def u32(self) -> int:
         """Read unsigned 32-bit integer (little-endian)."""
-        return struct.unpack("<I", self.read(4))[0]
+        return _U32.unpack_from(self.mv, self._advance(4))[0]
 
     def i32(self) -> int:
         """Read signed 32-bit integer (little-endian)."""
-        return struct.unpack("<i", self.read(4))[0]
+        return _I32.unpack_from(self.mv, self._advance(4))[0]
 
     def i64(self) -> int:
         """Read signed 64-bit integer (little-endian)."""
-        return struct.unpack("<q", self.read(8))[0]
+        return _I64.unpack_from(self.mv, self._advance(8))[0]
 
     def f32(self) -> float:
         """Read 32-bit float (little-endian)."""
-        return struct.unpack("<f", self.read(4))[0]
+        return _F32.unpack_from(self.mv, self._advance(4))[0]
 
     def u8(self) -> int:
         """Read unsigned 8-bit integer."""
-        return struct.unpack("<B", self.read(1))[0]
+        return self.mv[self._advance(1)]
 
     def read7bit_encoded_int(self) -> int:
         """
@@ -43,13 +66,39 @@ class BinReader:
 
         Matches the Go read7BitEncodedInt: read little-endian 7-bit continuation int32.
         """
-        num = 0
-        shift = 0
-        # Up to 5 bytes for 32-bit (Go caps at 35 bits in the loop)
+        try:
+            num, self.off = self.read7bit_from_mv(self.mv, self.off)
+        except IndexError:
+            raise EOFError("unexpected EOF") from None
+        return num
+
+    @staticmethod
+    def read7bit_from_mv(mv: memoryview, off: int) -> tuple[int, int]:
+        """
+        Read a 7-bit encoded integer directly from a memoryview.
+
+        Same encoding as read7bit_encoded_int, but indexes the buffer instead of
+        going through the stream, for parsers that track their own offset.
+
+        Returns:
+            Tuple of (value, offset just past the encoded integer)
+        """
+        b0 = mv[off]
+        # Single-byte fast path: covers every length below 128
+        if b0 < 0x80:
+            return b0, off + 1
+        # Two-byte fast path: covers every length below 16384
+        b1 = mv[off + 1]
+        if b1 < 0x80:
+            return (b0 & 0x7F) | (b1 << 7), off + 2
+        num = (b0 & 0x7F) | ((b1 & 0x7F) << 7)
+        off += 2
+        shift = 14
         while shift != 35:
-            b = self.u8()
+            b = mv[off]
+            off += 1
             num |= (b & 0x7F) << shift
             shift += 7
             if (b & 0x80) == 0:
-                return num
+                return num, off
         raise ValueError("too many bytes in what should have been a 7 bit encoded Int32")
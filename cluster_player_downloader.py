@@ -1,24 +1,42 @@
 #!/usr/bin/env python3
 
-import io
 import csv
 import logging
-import time
-from typing import Optional
+import struct
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator, Optional
 
 from binary_reader import BinReader
 from config import Config
 from helpers import platform_name, decode_seed_key, format_generation_capacity, encode_seed_key
 from models import PlayerData
-from utils import generate_random_steam_user_id, http_get
+from utils import RateLimiter, generate_random_steam_user_id, http_get
 
 logger = logging.getLogger(__name__)
 
+# Number of pages requested from the server concurrently
+_PAGE_FETCH_WORKERS = 4
+# Minimum seconds between two page requests
+_PAGE_REQUEST_INTERVAL = 0.5
+
+# Page header: version (Int32), total count (Int64), page index (Int32), record count (Int32)
+_HDR = struct.Struct("<iqii")
+# Fixed-width parts of a player record around the variable-length name:
+# seedKey (Int64), userId (Int64), platform (Byte) / genCap (Int64), isAnon (Byte)
+_PREFIX = struct.Struct("<qqB")
+_SUFFIX = struct.Struct("<qB")
+
 
 class ClusterPlayerDownloader:
     """Handles downloading and parsing DSP Milky Way cluster player data by seed."""
 
-    def __init__(self, config: Optional[Config] = None, platform: int = 1, user_id: Optional[int] = None):
+    def __init__(
+        self,
+        config: Optional[Config] = None,
+        platform: int = 1,
+        user_id: Optional[int] = None,
+        rate_limiter: Optional[RateLimiter] = None
+    ):
         """
         Initialize the cluster player downloader.
 
@@ -26,10 +44,14 @@ class ClusterPlayerDownloader:
             config: Configuration object (optional)
             platform: Platform ID (1=Steam, 2=WeGame, 3=XGP, 0=Standalone)
             user_id: User ID to use (optional, generates random if not provided)
+            rate_limiter: Limiter every page request waits on (optional, defaults
+                to at most one request per 0.5 second)
         """
         self.config = config or Config()
         self.user_id = user_id if user_id is not None else generate_random_steam_user_id()
         self.platform = platform
+        # Shared by every page request from this downloader, across threads
+        self.rate_limiter = rate_limiter if rate_limiter is not None else RateLimiter(_PAGE_REQUEST_INTERVAL)
 
     def download_and_parse_cluster_players(
         self,
@@ -37,7 +59,8 @@ class ClusterPlayerDownloader:
         stars: int,
         resource_mult: int,
         combat_diff: int,
-        max_pages: int = 10
+        max_pages: int = 10,
+        save_csv: bool = True
     ) -> list[PlayerData]:
         """
         Download and parse cluster player data for a specific seed.
@@ -48,6 +71,7 @@ class ClusterPlayerDownloader:
             resource_mult: Resource multiplier (raw value, e.g., 10 for 1.0x)
             combat_diff: Combat difficulty (raw value, 0 for peace mode)
             max_pages: Maximum number of pages to download (default 10)
+            save_csv: Save the players to cluster_players.csv (default True)
 
         Returns:
             List of PlayerData objects
@@ -58,52 +82,77 @@ class ClusterPlayerDownloader:
         try:
             # Encode the seed key
             seed_key = encode_seed_key(seed, stars, resource_mult, combat_diff)
-            logger.info(f"Encoded seed key: {seed_key} (seed={seed}, stars={stars}, res_mult={resource_mult}, combat={combat_diff})")
+            logger.info(
+                "Encoded seed key: %s (seed=%s, stars=%s, res_mult=%s, combat=%s)",
+                seed_key, seed, stars, resource_mult, combat_diff,
+            )
 
             all_players = []
             page_size = 10  # Fixed page size as per C# code
 
-            for page_index in range(max_pages):
-                # Wait 0.5 second before each API call
-                if page_index > 0:
-                    logger.info("Waiting 0.5 second before next request...")
-                    time.sleep(0.5)
-
-                logger.info(f"Fetching page {page_index}...")
-
-                # Download page
-                url = self.config.get_cluster_user_page_url(
-                    seed_key, page_index, page_size, self.user_id, self.platform
-                )
-                logger.info(f"URL: {url}")
+            # Everything but the page index is the same for every page
+            url_base = self.config.get_cluster_user_page_base_url(
+                seed_key, page_size, self.user_id, self.platform
+            )
 
-                data = http_get(url)
-                logger.info(f"Downloaded {len(data)} bytes")
+            for page_index, data in self._fetch_pages(url_base, max_pages):
+                logger.info("Downloaded %d bytes", len(data))
 
                 # Parse page
                 players, total_count, current_page = self._parse_cluster_page(data)
 
-                logger.info(f"Page {current_page}: Got {len(players)} players out of {total_count} total")
+                logger.info("Page %d: Got %d players out of %d total", current_page, len(players), total_count)
 
                 all_players.extend(players)
 
                 # If we got fewer players than page size, we've reached the end
                 if len(players) < page_size:
-                    logger.info(f"Reached end of data at page {page_index}")
+                    logger.info("Reached end of data at page %d", page_index)
                     break
 
-            logger.info(f"Successfully downloaded {len(all_players)} total player records")
+            logger.info("Successfully downloaded %d total player records", len(all_players))
 
             # Save to CSV
-            self._save_cluster_players_csv(all_players, seed, stars, resource_mult, combat_diff)
-            logger.info(f"Cluster players saved to: {self.config.cluster_players_csv}")
+            if save_csv:
+                self._save_cluster_players_csv(all_players, seed, stars, resource_mult, combat_diff)
+                logger.info("Cluster players saved to: %s", self.config.cluster_players_csv)
 
             return all_players
 
         except Exception as e:
-            logger.error(f"Failed to download and parse cluster players: {e}")
+            logger.error("Failed to download and parse cluster players: %s", e)
             raise RuntimeError(f"Failed to download and parse cluster players: {e}") from e
 
+    def _fetch_pages(self, url_base: str, max_pages: int) -> Iterator[tuple[int, bytes]]:
+        """
+        Download cluster pages in concurrent batches, each request waiting on
+        the rate limiter so requests start spaced out rather than all at once.
+
+        Args:
+            url_base: Cluster user page URL up to the page index value
+            max_pages: Maximum number of pages to download
+
+        Yields:
+            Tuples of (page_index, raw page data) in page order. Stopping the
+            iteration early stops requesting further batches.
+        """
+        with ThreadPoolExecutor(max_workers=_PAGE_FETCH_WORKERS) as executor:
+            for batch_start in range(0, max_pages, _PAGE_FETCH_WORKERS):
+                page_indices = range(batch_start, min(batch_start + _PAGE_FETCH_WORKERS, max_pages))
+                urls = []
+                for page_index in page_indices:
+                    logger.info("Fetching page %d...", page_index)
+                    url = f"{url_base}{page_index}"
+                    logger.info("URL: %s", url)
+                    urls.append(url)
+
+                yield from zip(page_indices, executor.map(self._get_page, urls))
+
+    def _get_page(self, url: str) -> bytes:
+        """Download one cluster page once the rate limiter allows it."""
+        self.rate_limiter.wait()
+        return http_get(url)
+
     def _parse_cluster_page(self, data: bytes) -> tuple[list[PlayerData], int, int]:
         """
         Parse a single page of cluster player data.
@@ -128,37 +177,30 @@ class ClusterPlayerDownloader:
             - Byte: isAnon
         """
         players = []
+        mv = memoryview(data)
 
-        with io.BytesIO(data) as stream:
-            r = BinReader(stream)
-
-            # Read header/version (unused)
-            _ = r.i32()
-
-            # Read total count
-            total_count = r.i64()
-
-            # Read current page index
-            page_index = r.i32()
-
-            # Read number of records in this page
-            num_records = r.i32()
+        try:
+            # Read header/version (unused), total count, current page index and
+            # number of records in this page
+            _, total_count, page_index, num_records = _HDR.unpack_from(mv, 0)
+            off = _HDR.size
 
-            logger.info(f"Parsing page {page_index}: {num_records} records (total: {total_count})")
+            logger.info("Parsing page %d: %d records (total: %d)", page_index, num_records, total_count)
 
             # Read each player record (up to 10)
             for _ in range(min(num_records, 10)):
-                seed_key = r.i64()
-                user_id = r.i64()
-                platform = r.u8()
+                seed_key, user_id, platform = _PREFIX.unpack_from(mv, off)
+                off += _PREFIX.size
 
                 # ReadString in C# BinaryReader: reads 7-bit encoded length, then UTF-8 bytes
-                name_len = r.read7bit_encoded_int()
-                name_bytes = r.read(name_len)
-                name = name_bytes.decode("utf-8", errors="replace")
+                name_len, off = BinReader.read7bit_from_mv(mv, off)
+                if off + name_len > len(mv):
+                    raise EOFError("unexpected EOF")
+                name = bytes(mv[off:off + name_len]).decode("utf-8", errors="replace")
+                off += name_len
 
-                gen_cap = r.i64()
-                is_anon = r.u8()
+                gen_cap, is_anon = _SUFFIX.unpack_from(mv, off)
+                off += _SUFFIX.size
 
                 # Decode seed key
                 seed, stars, res_mult, combat = decode_seed_key(seed_key)
@@ -175,6 +217,9 @@ class ClusterPlayerDownloader:
                     is_anonymous=is_anon > 0,
                 )
                 players.append(player)
+        except (struct.error, IndexError):
+            # Truncated input: report it like BinReader does
+            raise EOFError("unexpected EOF") from None
 
         return players, total_count, page_index
 
@@ -198,7 +243,7 @@ class ClusterPlayerDownloader:
         """
         self.config.ensure_output_dir()
 
-        with open(self.config.cluster_players_csv, "w", newline="", encoding="utf-8") as f:
+        with open(self.config.cluster_players_csv, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             w = csv.writer(f)
             # Write header with Chinese labels
             w.writerow(
@@ -206,17 +251,17 @@ class ClusterPlayerDownloader:
             )
 
             # Write player data
-            for player in players:
-                w.writerow(
-                    [
-                        str(player.seed),
-                        str(player.stars),
-                        player.resource_multiplier,
-                        player.combat_difficulty,
-                        str(player.user_id),
-                        player.platform,
-                        player.account_name,
-                        player.generation_capacity,
-                        str(player.is_anonymous),
-                    ]
+            w.writerows(
+                (
+                    str(player.seed),
+                    str(player.stars),
+                    player.resource_multiplier,
+                    player.combat_difficulty,
+                    str(player.user_id),
+                    player.platform,
+                    player.account_name,
+                    player.generation_capacity,
+                    str(player.is_anonymous),
                 )
+                for player in players
+            )
@@ -2,6 +2,7 @@
 
 import os
 from dataclasses import dataclass
+from functools import cached_property
 
 
 @dataclass
@@ -16,32 +17,37 @@ class Config:
     get_cluster_user_page_api: str = "query/clusteruserpage"
     output_dir: str = "output"
 
-    @property
+    @cached_property
     def top_ten_csv(self) -> str:
         """Get path for top ten CSV file in output directory."""
         return os.path.join(self.output_dir, "top_ten.csv")
 
-    @property
+    @cached_property
     def summary_txt(self) -> str:
         """Get path for summary text file in output directory."""
         return os.path.join(self.output_dir, "summary.txt")
 
-    @property
+    @cached_property
     def all_csv(self) -> str:
         """Get path for all seeds CSV file in output directory."""
         return os.path.join(self.output_dir, "all.csv")
 
-    @property
+    @cached_property
     def statistics_txt(self) -> str:
         """Get path for statistics text file in output directory."""
         return os.path.join(self.output_dir, "statistics.txt")
 
-    @property
+    @cached_property
     def user_data_csv(self) -> str:
         """Get path for user data CSV file in output directory."""
         return os.path.join(self.output_dir, "user_data.csv")
 
-    @property
+    @cached_property
+    def user_data_bin(self) -> str:
+        """Get path for the raw user data download in output directory."""
+        return os.path.join(self.output_dir, "user_data.bin")
+
+    @cached_property
     def cluster_players_csv(self) -> str:
         """Get path for cluster players CSV file in output directory."""
         return os.path.join(self.output_dir, "cluster_players.csv")
@@ -62,9 +68,13 @@ class Config:
         """Get the all user data URL with user ID and platform."""
         return f"{self.server_address}{self.get_all_user_data_api}?user_id={user_id}&platform={platform}"
 
+    def get_cluster_user_page_base_url(self, seed_key: int, page_size: int, user_id: int, platform: int) -> str:
+        """Get the cluster user page URL with all parameters except the trailing page index value."""
+        return f"{self.server_address}{self.get_cluster_user_page_api}?seed={seed_key}&page_size={page_size}&user_id={user_id}&platform={platform}&page_index="
+
     def get_cluster_user_page_url(self, seed_key: int, page_index: int, page_size: int, user_id: int, platform: int) -> str:
         """Get the cluster user page URL with all parameters."""
-        return f"{self.server_address}{self.get_cluster_user_page_api}?seed={seed_key}&page_index={page_index}&page_size={page_size}&user_id={user_id}&platform={platform}"
+        return f"{self.get_cluster_user_page_base_url(seed_key, page_size, user_id, platform)}{page_index}"
 
     def ensure_output_dir(self) -> None:
         """Create output directory if it doesn't exist."""
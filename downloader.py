@@ -1,20 +1,35 @@
 #!/usr/bin/env python3
 
-import io
 import os
+import contextlib
 import csv
 import gzip
 import logging
+import shutil
+import struct
 from typing import Optional
 
 from binary_reader import BinReader
 from config import Config
 from helpers import platform_name, decode_seed_key, format_generation_capacity
-from models import PlayerData, SeedData, Summary
-from utils import generate_random_steam_user_id, login, fetch_full_data
+from models import PlayerData, Summary
+from utils import generate_random_steam_user_id, login, fetch_full_data_to_file
 
 logger = logging.getLogger(__name__)
 
+# File header: version (UInt32)
+_U32 = struct.Struct("<I")
+# Block header: tag / version (UInt32), record count (Int32)
+_BLOCK_HDR = struct.Struct("<Ii")
+# Summary block: version (UInt32), genCap (Int64), sails (Int64), players (Int32), dyson spheres (Int32)
+_SUMMARY = struct.Struct("<Iqqii")
+# Aggregated seed record: seedKey (Int64), genCap (Float32), players (Int32), trailing UInt32
+_SEED = struct.Struct("<qfiI")
+# Fixed-width parts of a player record around the variable-length name:
+# seedKey (Int64), userId (Int64), platform (Byte) / genCap (Int64), isAnon (Byte)
+_PREFIX = struct.Struct("<qqB")
+_SUFFIX = struct.Struct("<qB")
+
 
 class FullDataDownloader:
     """Handles downloading and parsing DSP Milky Way full data."""
@@ -63,16 +78,23 @@ class FullDataDownloader:
             # Create output directory if it doesn't exist
             self.config.ensure_output_dir()
 
-            full_data = fetch_full_data(self.full_data_url)
             filename = os.path.join(
                 self.config.output_dir, self.full_data_url.split("/")[-1]
             )
-
-            with gzip.GzipFile(fileobj=io.BytesIO(full_data)) as gzf, open(
-                filename, "wb"
-            ) as f:
-                chunk = gzf.read()
-                f.write(chunk)
+            gz_filename = filename + ".gz"
+
+            # Save the compressed body straight to disk, then stream-decompress
+            # it in 1 MiB chunks so neither payload is held in memory
+            try:
+                fetch_full_data_to_file(self.full_data_url, gz_filename)
+                with gzip.open(gz_filename, "rb") as gzf, open(
+                    filename, "wb", buffering=1 << 20
+                ) as f:
+                    shutil.copyfileobj(gzf, f, length=1 << 20)
+            finally:
+                # Also removes a partial download if fetching failed
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(gz_filename)
 
             logger.info(f"Full data downloaded and saved to: {filename}")
             return filename
@@ -93,11 +115,17 @@ class FullDataDownloader:
             RuntimeError: If parsing fails
         """
         try:
+            # Read the whole file once and parse it block by block
             with open(filename, "rb") as f:
-                r = BinReader(f)
-                _ = r.u32()  # header version (unused)
-                self._load_top_ten_player_data(r)
-                self._load_other_data(r)
+                data = f.read()
+            mv = memoryview(data)
+            try:
+                _ = _U32.unpack_from(mv, 0)  # header version (unused)
+                off = self._load_top_ten_player_data(mv, _U32.size)
+                self._load_other_data(mv, off)
+            except (struct.error, IndexError):
+                # Truncated input: report it like BinReader does
+                raise EOFError("unexpected EOF") from None
             logger.info("Successfully parsed full data")
         except FileNotFoundError:
             logger.error(f"File not found: {filename}")
@@ -106,28 +134,33 @@ class FullDataDownloader:
             logger.error(f"Failed to parse full data: {e}")
             raise RuntimeError(f"Failed to parse full data: {e}") from e
 
-    def _load_top_ten_player_data(self, r: BinReader) -> None:
+    def _load_top_ten_player_data(self, mv: memoryview, off: int) -> int:
         """
         Load and save top ten player data to CSV.
 
         Args:
-            r: Binary reader instance
+            mv: Memoryview over the whole data file
+            off: Offset of the top ten block
+
+        Returns:
+            Offset just past the top ten block
         """
-        _ = r.u32()  # block tag / version (unused)
-        num = r.i32()
+        _, num = _BLOCK_HDR.unpack_from(mv, off)  # block tag / version (unused), count
+        off += _BLOCK_HDR.size
 
         players = []
         for _ in range(num):
-            seed_key = r.i64()
-            user_id = r.i64()
-            platform = r.u8()
+            seed_key, user_id, platform = _PREFIX.unpack_from(mv, off)
+            off += _PREFIX.size
 
-            name_len = r.read7bit_encoded_int()
-            name_bytes = r.read(name_len)
-            name = name_bytes.decode("utf-8", errors="replace")
+            name_len, off = BinReader.read7bit_from_mv(mv, off)
+            if off + name_len > len(mv):
+                raise EOFError("unexpected EOF")
+            name = bytes(mv[off:off + name_len]).decode("utf-8", errors="replace")
+            off += name_len
 
-            gen_cap = r.i64()
-            is_anon = r.u8()
+            gen_cap, is_anon = _SUFFIX.unpack_from(mv, off)
+            off += _SUFFIX.size
 
             seed, stars, res_mult, combat = decode_seed_key(seed_key)
 
@@ -146,43 +179,44 @@ class FullDataDownloader:
 
         self._save_top_ten_csv(players)
         logger.info(f"Loaded {len(players)} top ten player records")
+        return off
 
     def _save_top_ten_csv(self, players: list[PlayerData]) -> None:
         """Save top ten player data to CSV file."""
-        with open(self.config.top_ten_csv, "w", newline="", encoding="utf-8") as of:
+        with open(self.config.top_ten_csv, "w", newline="", encoding="utf-8", buffering=1 << 20) as of:
             w = csv.writer(of)
             w.writerow(
                 ["种子", "星数", "资源倍率", "战斗难度", "用户ID", "平台", "账号", "发电量", "匿名"]
             )
 
-            for player in players:
-                w.writerow(
-                    [
-                        str(player.seed),
-                        str(player.stars),
-                        player.resource_multiplier,
-                        player.combat_difficulty,
-                        str(player.user_id),
-                        player.platform,
-                        player.account_name,
-                        player.generation_capacity,
-                        str(player.is_anonymous),
-                    ]
+            w.writerows(
+                (
+                    str(player.seed),
+                    str(player.stars),
+                    player.resource_multiplier,
+                    player.combat_difficulty,
+                    str(player.user_id),
+                    player.platform,
+                    player.account_name,
+                    player.generation_capacity,
+                    str(player.is_anonymous),
                 )
+                for player in players
+            )
 
-    def _load_other_data(self, r: BinReader) -> None:
+    def _load_other_data(self, mv: memoryview, off: int) -> None:
         """
         Load summary and aggregated seed data.
 
         Args:
-            r: Binary reader instance
+            mv: Memoryview over the whole data file
+            off: Offset of the summary block
         """
         # Summary block
-        _ = r.u32()  # version (unused)
-        total_gen_cap = r.i64()
-        total_sail_launched = r.i64()
-        total_player = r.i32()
-        total_dyson_sphere = r.i32()
+        _, total_gen_cap, total_sail_launched, total_player, total_dyson_sphere = (
+            _SUMMARY.unpack_from(mv, off)
+        )
+        off += _SUMMARY.size
 
         summary = Summary(
             total_players=total_player,
@@ -195,32 +229,14 @@ class FullDataDownloader:
         logger.info(f"Loaded summary: {total_player} players, {total_dyson_sphere} dyson spheres")
 
         # Aggregated per-seed block
-        _ = r.u32()  # version (unused)
-        num = r.i32()
+        _, num = _BLOCK_HDR.unpack_from(mv, off)  # version (unused), count
+        off += _BLOCK_HDR.size
+        end = off + num * _SEED.size
+        if end > len(mv):
+            raise EOFError("unexpected EOF")
 
-        seeds = []
-        for _ in range(num):
-            seed_key = r.i64()
-            gen_cap = r.f32()
-            player_num = r.i32()
-
-            seed, stars, res_mult, combat = decode_seed_key(seed_key)
-
-            seed_data = SeedData(
-                seed=seed,
-                stars=stars,
-                resource_multiplier=res_mult,
-                combat_difficulty=combat,
-                player_count=player_num,
-                total_generation_capacity=format_generation_capacity(int(gen_cap * 60)),
-            )
-            seeds.append(seed_data)
-
-            # The Go code reads an extra uint32 after each entry
-            _ = r.u32()
-
-        self._save_all_csv(seeds)
-        logger.info(f"Loaded {len(seeds)} seed records")
+        count = self._save_all_csv(mv[off:end])
+        logger.info(f"Loaded {count} seed records")
 
     def _save_summary(self, summary: Summary) -> None:
         """Save summary statistics to text file."""
@@ -232,20 +248,35 @@ class FullDataDownloader:
                 f"总戴森球数: {summary.total_dyson_spheres}\n"
             )
 
-    def _save_all_csv(self, seeds: list[SeedData]) -> None:
-        """Save aggregated seed data to CSV file."""
-        with open(self.config.all_csv, "w", newline="", encoding="utf-8") as of:
-            w = csv.writer(of)
-            w.writerow(["种子", "星数", "资源倍率", "战斗难度", "用户数", "总发电量"])
-
-            for seed in seeds:
-                w.writerow(
-                    [
-                        str(seed.seed),
-                        str(seed.stars),
-                        seed.resource_multiplier,
-                        seed.combat_difficulty,
-                        str(seed.player_count),
-                        seed.total_generation_capacity,
-                    ]
+    def _save_all_csv(self, seed_block: memoryview) -> int:
+        """
+        Decode the aggregated seed block straight into the all seeds CSV file.
+
+        Rows are written as they are decoded, without building SeedData objects.
+        None of the seed fields can contain a comma, quote or newline, so the
+        rows are formatted directly (keeping csv.writer's default CRLF line
+        terminator) instead of going through csv.writer's quoting logic.
+
+        Args:
+            seed_block: Memoryview over the packed seed records
+
+        Returns:
+            Number of seed records written
+        """
+        count = 0
+        with open(self.config.all_csv, "w", newline="", encoding="utf-8", buffering=1 << 20) as of:
+            # Hot loop over every seed: bind the callables to locals once
+            write = of.write
+            decode = decode_seed_key
+            fmt_gen_cap = format_generation_capacity
+            write("种子,星数,资源倍率,战斗难度,用户数,总发电量\r\n")
+            # The Go code reads an extra uint32 after each entry, which is the
+            # unused last field here
+            for seed_key, gen_cap, player_num, _ in _SEED.iter_unpack(seed_block):
+                seed, stars, res_mult, combat = decode(seed_key)
+                write(
+                    f"{seed},{stars},{res_mult},{combat},{player_num},"
+                    f"{fmt_gen_cap(int(gen_cap * 60))}\r\n"
                 )
+                count += 1
+        return count
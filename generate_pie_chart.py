@@ -5,63 +5,84 @@ Downloads cluster data for seeds with > 100TW generation capacity.
 """
 
 import csv
+import functools
 import logging
 import os
-import re
-import time
+import string
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import repeat
 
 import matplotlib.pyplot as plt
+from matplotlib import font_manager
 from cluster_player_downloader import ClusterPlayerDownloader
 from config import Config
+from utils import RateLimiter
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Number of seeds whose cluster pages are downloaded concurrently
+_SEED_DOWNLOAD_WORKERS = 4
+# Minimum seconds between two cluster page requests, across all workers
+_PAGE_REQUEST_INTERVAL = 0.5
+
+_POWER_MULTIPLIERS = {
+    'pw': 1_000_000_000_000_000,
+    'tw': 1_000_000_000_000,
+    'gw': 1_000_000_000,
+    'mw': 1_000_000,
+    'kw': 1_000,
+    'w': 1,
+}
+
+# Scale factor from watts to petawatts for display
+_WATTS_TO_PW = 1e-15
+
+@functools.lru_cache(maxsize=None)
 def parse_power_to_watts(power_str: str) -> int:
     """
     Parse power strings like "20.6 PW", "100 TW", "1000 kW", "1000 KW" to watts.
+
+    Results are cached: all.csv and the cluster pages only ever contain a few
+    thousand distinct formatted values (three significant digits per unit), so
+    most rows are parsed with a single dict lookup.
     """
     s = power_str.strip()
     # allow commas like "1,000 kW"
     s = s.replace(",", "")
 
-    match = re.match(r'^([\d.]+)\s*([a-zA-Z]+W?)$', s)
-    if not match:
+    # split "<number> <unit>" at the trailing run of letters
+    number = s.rstrip(string.ascii_letters)
+    unit = s[len(number):].lower()  # normalize: "kW", "KW" -> "kw"
+    number = number.rstrip()
+    if not unit or not number or number.strip("0123456789."):
         logger.warning(f"Could not parse power string: {power_str}")
         return 0
 
-    value = float(match.group(1))
-    unit = match.group(2).strip().lower()  # normalize: "kW", "KW" -> "kw"
-
-    multipliers = {
-        'pw': 1_000_000_000_000_000,
-        'tw': 1_000_000_000_000,
-        'gw': 1_000_000_000,
-        'mw': 1_000_000,
-        'kw': 1_000,
-        'w': 1,
-    }
+    try:
+        value = float(number)
+    except ValueError:
+        logger.warning(f"Could not parse power string: {power_str}")
+        return 0
 
     # handle cases like "kw" vs "kw" (already) and optional missing W
     unit = unit if unit.endswith('w') else unit + 'w'
 
-    return int(value * multipliers.get(unit, 1))
+    return int(value * _POWER_MULTIPLIERS.get(unit, 1))
 def resource_multiplier_to_raw(mult_str: str) -> int:
     """Convert resource multiplier string to raw value."""
     if mult_str == "无限":
         return 99
-    return int(float(mult_str) * 10)
+    # round rather than truncate so float error can never drop a tenth
+    return round(float(mult_str) * 10)
 
 
 def combat_difficulty_to_raw(diff_str: str) -> int:
     """Convert combat difficulty string to raw value."""
     if diff_str == "和平模式":
         return 0
-    if (len(diff_str) == 1):
-        return int("10" + diff_str)
-    
-    return int("1" + diff_str)
+    return 100 + int(diff_str)
 
 
 def load_high_capacity_seeds(all_csv_path: str, min_watts: int = 100_000_000_000_000) -> list[dict]:
@@ -79,21 +100,32 @@ def load_high_capacity_seeds(all_csv_path: str, min_watts: int = 100_000_000_000
 
     logger.info(f"Reading {all_csv_path}...")
 
-    with open(all_csv_path, 'r', encoding='utf-8') as f:
-        reader = csv.DictReader(f)
+    with open(all_csv_path, 'r', encoding='utf-8', newline='', buffering=1 << 20) as f:
+        # Plain rows instead of DictReader: only the few matching rows need named fields
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return high_capacity_seeds
+        col = {name: i for i, name in enumerate(header)}
+        seed_i, stars_i = col['种子'], col['星数']
+        res_i, combat_i = col['资源倍率'], col['战斗难度']
+        gen_cap_i, users_i = col['总发电量'], col['用户数']
 
         for row in reader:
-            gen_cap_watts = parse_power_to_watts(row['总发电量'])
+            # Skip blank lines, as DictReader did
+            if not row:
+                continue
+            gen_cap_watts = parse_power_to_watts(row[gen_cap_i])
 
             if gen_cap_watts >= min_watts:
                 seed_info = {
-                    'seed': int(row['种子']),
-                    'stars': int(row['星数']),
-                    'resource_mult': row['资源倍率'],
-                    'combat_diff': row['战斗难度'],
+                    'seed': int(row[seed_i]),
+                    'stars': int(row[stars_i]),
+                    'resource_mult': row[res_i],
+                    'combat_diff': row[combat_i],
                     'gen_cap_watts': gen_cap_watts,
-                    'gen_cap_str': row['总发电量'],
-                    'user_count': int(row['用户数'])
+                    'gen_cap_str': row[gen_cap_i],
+                    'user_count': int(row[users_i])
                 }
                 high_capacity_seeds.append(seed_info)
 
@@ -102,10 +134,51 @@ def load_high_capacity_seeds(all_csv_path: str, min_watts: int = 100_000_000_000
     return high_capacity_seeds
 
 
+def _download_seed_players(downloader: ClusterPlayerDownloader, seed_info: dict, i: int, total: int) -> list:
+    """
+    Download the cluster players for one seed.
+
+    Args:
+        downloader: Cluster player downloader to use
+        seed_info: Seed info dictionary
+        i: Index of the seed (for logging)
+        total: Number of seeds (for logging)
+
+    Returns:
+        List of PlayerData objects, empty if the download failed
+    """
+    logger.info(f"\n=== Processing seed {i+1}/{total} ===")
+    logger.info(f"Seed: {seed_info['seed']}, Stars: {seed_info['stars']}, "
+               f"Resource: {seed_info['resource_mult']}, Combat: {seed_info['combat_diff']}")
+    logger.info(f"Total generation: {seed_info['gen_cap_str']} ({seed_info['user_count']} users)")
+
+    # Convert to raw values for API
+    resource_mult_raw = resource_multiplier_to_raw(seed_info['resource_mult'])
+    combat_diff_raw = combat_difficulty_to_raw(seed_info['combat_diff'])
+
+    try:
+        # Download cluster data; player.csv below replaces the per-call cluster_players.csv
+        return downloader.download_and_parse_cluster_players(
+            seed=seed_info['seed'],
+            stars=seed_info['stars'],
+            resource_mult=resource_mult_raw,
+            combat_diff=combat_diff_raw,
+            max_pages=2,
+            save_csv=False
+        )
+    except Exception as e:
+        logger.error(f"Failed to download cluster data for seed {seed_info['seed']}: {e}")
+        return []
+
+
 def download_cluster_data_for_seeds(seeds: list[dict], config: Config) -> list[dict]:
     """
     Download cluster player data for all seeds.
 
+    Seeds are downloaded concurrently; results are processed in seed order.
+    Page requests from all workers share one rate limiter to be polite to the
+    server, so they still start at most one per _PAGE_REQUEST_INTERVAL.
+
     Args:
         seeds: List of seed info dictionaries
         config: Configuration object
@@ -113,67 +186,55 @@ def download_cluster_data_for_seeds(seeds: list[dict], config: Config) -> list[d
     Returns:
         List of player dictionaries with steam_id, name, gen_cap_watts
     """
-    downloader = ClusterPlayerDownloader(config=config)
+    downloader = ClusterPlayerDownloader(config=config, rate_limiter=RateLimiter(_PAGE_REQUEST_INTERVAL))
     all_players = []
 
-    for i, seed_info in enumerate(seeds):
-        time.sleep(0.5)  # Be polite to the server
-        logger.info(f"\n=== Processing seed {i+1}/{len(seeds)} ===")
-        logger.info(f"Seed: {seed_info['seed']}, Stars: {seed_info['stars']}, "
-                   f"Resource: {seed_info['resource_mult']}, Combat: {seed_info['combat_diff']}")
-        logger.info(f"Total generation: {seed_info['gen_cap_str']} ({seed_info['user_count']} users)")
-
-        # Convert to raw values for API
-        resource_mult_raw = resource_multiplier_to_raw(seed_info['resource_mult'])
-        combat_diff_raw = combat_difficulty_to_raw(seed_info['combat_diff'])
-
+    # append into a csv file for reference, keeping one handle open for all seeds
+    csv_path = os.path.join(config.output_dir, "player.csv")
+    with open(csv_path, 'a', encoding='utf-8', newline='', buffering=1 << 20) as csvfile, \
+            ThreadPoolExecutor(max_workers=_SEED_DOWNLOAD_WORKERS) as executor:
+        writer = csv.writer(csvfile)
+        if csvfile.tell() == 0:
+            writer.writerow(['种子', '星数', '资源倍率', '战斗难度', '用户ID', '平台', '账号', '发电量', '匿名'])
+
+        results = executor.map(
+            _download_seed_players,
+            repeat(downloader), seeds, range(len(seeds)), repeat(len(seeds))
+        )
         try:
-            # Download cluster data
-            players = downloader.download_and_parse_cluster_players(
-                seed=seed_info['seed'],
-                stars=seed_info['stars'],
-                resource_mult=resource_mult_raw,
-                combat_diff=combat_diff_raw,
-                max_pages=2
-            )
-            
-            # append into a csv file for reference
-            csv_path = os.path.join(config.output_dir, f"player.csv")
-            with open(csv_path, 'a', encoding='utf-8', newline='') as csvfile:
-                fieldnames = ['种子', '星数', '资源倍率', '战斗难度', '用户ID', '平台', '账号', '发电量', '匿名']
-                writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-                if os.path.getsize(csv_path) == 0:
-                    writer.writeheader()
-                for player in players:
-                    writer.writerow({
-                        '种子': seed_info['seed'],
-                        '星数': seed_info['stars'],
-                        '资源倍率': seed_info['resource_mult'],
-                        '战斗难度': seed_info['combat_diff'],
-                        '用户ID': player.user_id,
-                        '平台': player.platform,
-                        '账号': player.account_name,
-                        '发电量': player.generation_capacity,
-                        '匿名': player.is_anonymous
-                    }) 
-        
-
-            # Convert to simplified format
-            for player in players:
-                # Only include Steam players (platform ID 1)
-                if player.platform == "Steam":
-                    gen_cap_watts = parse_power_to_watts(player.generation_capacity)
-                    all_players.append({
+            for seed_info, players in zip(seeds, results):
+                writer.writerows(
+                    (
+                        seed_info['seed'],
+                        seed_info['stars'],
+                        seed_info['resource_mult'],
+                        seed_info['combat_diff'],
+                        player.user_id,
+                        player.platform,
+                        player.account_name,
+                        player.generation_capacity,
+                        player.is_anonymous,
+                    )
+                    for player in players
+                )
+
+                # Convert to simplified format, only including Steam players (platform ID 1)
+                steam_players = [player for player in players if player.platform == "Steam"]
+                all_players.extend(
+                    {
                         'steam_id': player.user_id,
                         'name': player.account_name,
-                        'gen_cap_watts': gen_cap_watts
-                    })
-
-            logger.info(f"Added {len([p for p in players])} Steam players from this seed")
-
-        except Exception as e:
-            logger.error(f"Failed to download cluster data for seed {seed_info['seed']}: {e}")
-            continue
+                        'gen_cap_watts': parse_power_to_watts(player.generation_capacity)
+                    }
+                    for player in steam_players
+                )
+
+                logger.info(f"Added {len(steam_players)} Steam players from this seed")
+        except BaseException:
+            # Drop the queued seeds so leaving the pool only waits for the
+            # downloads already running (e.g. on Ctrl-C or a failed write)
+            executor.shutdown(wait=False, cancel_futures=True)
+            raise
 
     logger.info(f"\n=== Total: {len(all_players)} Steam player records ===")
     return all_players
@@ -186,18 +247,30 @@ def aggregate_by_steam_id(players: list[dict]) -> dict:
         players: List of player dictionaries
 
     Returns:
-        Dictionary mapping steam_id to {'names': set, 'total_gen_cap': int}
+        Dictionary (a defaultdict, returned without copying) mapping steam_id to
+        {'names': list (may repeat), 'total_gen_cap': int}
     """
-    aggregated = defaultdict(lambda: {'names': set(), 'total_gen_cap': 0})
+    aggregated = defaultdict(lambda: {'names': [], 'total_gen_cap': 0})
 
+    # One hash lookup per record: fetch the entry once and update it in place
     for player in players:
-        steam_id = player['steam_id']
-        aggregated[steam_id]['names'].add(player['name'])
-        aggregated[steam_id]['total_gen_cap'] += player['gen_cap_watts']
+        entry = aggregated[player['steam_id']]
+        entry['names'].append(player['name'])
+        entry['total_gen_cap'] += player['gen_cap_watts']
 
     logger.info(f"Aggregated {len(players)} records into {len(aggregated)} unique Steam IDs")
 
-    return dict(aggregated)
+    return aggregated
+
+
+@functools.lru_cache(maxsize=1)
+def _configure_fonts():
+    """Configure fonts to support Chinese characters (once per process)."""
+    plt.rcParams["font.sans-serif"] = ["Noto Sans CJK SC", "Noto Sans CJK", "WenQuanYi Zen Hei", "DejaVu Sans"]
+    plt.rcParams["font.family"] = "sans-serif"
+    plt.rcParams["axes.unicode_minus"] = False
+    # Resolve the font now so the font manager lookup is cached before drawing
+    font_manager.findfont(font_manager.FontProperties(family=["sans-serif"]))
 
 
 def generate_pie_chart(aggregated: dict, output_path: str, top_n: int = 30):
@@ -205,27 +278,23 @@ def generate_pie_chart(aggregated: dict, output_path: str, top_n: int = 30):
     Generate a pie chart of generation capacity by Steam ID.
 
     Args:
-        aggregated: Dictionary of {steam_id: {'names': set, 'total_gen_cap': int}}
+        aggregated: Dictionary of {steam_id: {'names': list, 'total_gen_cap': int}}
         output_path: Path to save the chart
         top_n: Number of top users to show individually (others grouped as "Others")
     """
-    # Configure font to support Chinese characters
-    plt.rcParams["font.sans-serif"] = ["Noto Sans CJK SC", "Noto Sans CJK", "WenQuanYi Zen Hei", "DejaVu Sans"]
-    plt.rcParams["font.family"] = "sans-serif"
-    plt.rcParams["axes.unicode_minus"] = False
-
+    _configure_fonts()
 
-    # Sort by generation capacity
+    # Rank by generation capacity; the stats CSV needs the full ranking
     sorted_users = sorted(aggregated.items(), key=lambda x: x[1]['total_gen_cap'], reverse=True)
+    # Combine all names with " / ", once per user for the labels, CSV and log
+    user_names = [' / '.join(sorted(set(data['names']))) for _, data in sorted_users]
 
     # Prepare data for pie chart
     labels = []
     sizes = []
 
     # Top N users
-    for steam_id, data in sorted_users[:top_n]:
-        # Combine all names with " / "
-        display_name = ' / '.join(sorted(data['names']))
+    for (steam_id, data), display_name in zip(sorted_users[:top_n], user_names):
         # Truncate if too long
         if len(display_name) > 50:
             display_name = display_name[:47] + '...'
@@ -237,7 +306,7 @@ def generate_pie_chart(aggregated: dict, output_path: str, top_n: int = 30):
     # Group remaining as "Others"
     if len(sorted_users) > top_n:
         others_total = sum(data['total_gen_cap'] for _, data in sorted_users[top_n:])
-        others_tw = others_total / 1_000_000_000_000_000
+        others_tw = others_total * _WATTS_TO_PW
         labels.append(f"杂鱼们 (共{len(sorted_users) - top_n} 杂鱼)\n({others_tw:.1f} PW)")
         sizes.append(others_total)
 
@@ -247,11 +316,11 @@ def generate_pie_chart(aggregated: dict, output_path: str, top_n: int = 30):
 
     # Custom autopct function to show generation capacity instead of percentage
     def make_autopct(values):
+        # PW per percentage point, computed once rather than per wedge
+        pw_per_pct = sum(values) / 100.0 * _WATTS_TO_PW
+
         def autopct_func(pct):
-            total = sum(values)
-            val = pct * total / 100.0
-            gen_cap_pw = val / 1_000_000_000_000_000
-            return f'{gen_cap_pw:.1f} PW'
+            return f'{pct * pw_per_pct:.1f} PW'
         return autopct_func
 
     plt.pie(sizes, labels=labels, autopct=make_autopct(sizes), startangle=90, colors=colors)
@@ -269,29 +338,28 @@ def generate_pie_chart(aggregated: dict, output_path: str, top_n: int = 30):
     # save all sorted users to a csv for reference
     stats_csv_path = os.path.splitext(output_path)[0] + '_stats.csv'
     with open(stats_csv_path, 'w', encoding='utf-8', newline='') as csvfile:
-        fieldnames = ['Rank', 'Steam ID', 'Names', 'Generation Capacity (PW)']
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        for i, (steam_id, data) in enumerate(sorted_users, 1):
-            names = ' / '.join(sorted(data['names']))
-            gen_cap_tw = data['total_gen_cap'] / 1_000_000_000_000_000
-            writer.writerow({
-                'Rank': i,
-                'Steam ID': steam_id,
-                'Names': names,
-                'Generation Capacity (PW)': f"{gen_cap_tw:.2f}"
-            })
+        writer = csv.writer(csvfile)
+        writer.writerow(['Rank', 'Steam ID', 'Names', 'Generation Capacity (PW)'])
+        writer.writerows(
+            (
+                i,
+                steam_id,
+                names,
+                f"{data['total_gen_cap'] * _WATTS_TO_PW:.2f}",
+            )
+            for i, ((steam_id, data), names) in enumerate(zip(sorted_users, user_names), 1)
+        )
     logger.info(f"Statistics saved to: {stats_csv_path}")
     
-    for i, (steam_id, data) in enumerate(sorted_users[:10], 1):
-        names = ' / '.join(sorted(data['names']))
-        gen_cap_tw = data['total_gen_cap'] / 1_000_000_000_000_000
+    for i, ((steam_id, data), names) in enumerate(zip(sorted_users[:10], user_names), 1):
+        gen_cap_tw = data['total_gen_cap'] * _WATTS_TO_PW
         logger.info(f"{i}. Steam ID {steam_id}: {names} - {gen_cap_tw:.2f} PW")
 
 
 def main():
     """Main function to generate pie chart."""
     config = Config()
+    _configure_fonts()
 
     # Path to all.csv
     all_csv_path = os.path.join(config.output_dir, 'all.csv')
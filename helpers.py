@@ -1,9 +1,12 @@
 #!/usr/bin/env python3
 
 
+_PLATFORM_NAMES = {1: "Steam", 2: "WeGame", 3: "XGP"}
+
+
 def platform_name(pid: int) -> str:
     """Convert platform ID to platform name."""
-    return {1: "Steam", 2: "WeGame", 3: "XGP"}.get(pid, "Standalone")
+    return _PLATFORM_NAMES.get(pid, "Standalone")
 
 
 def resource_multiplier(n: int) -> str:
@@ -20,6 +23,16 @@ def combat_mode_difficulty_number(n: int) -> str:
     return str(n % 100)
 
 
+_POWER_UNITS = (
+    (1_000_000_000_000_000, "PW"),  # Petawatts
+    (1_000_000_000_000, "TW"),      # Terawatts
+    (1_000_000_000, "GW"),          # Gigawatts
+    (1_000_000, "MW"),              # Megawatts
+    (1_000, "kW"),                  # Kilowatts
+    (1, "W"),                       # Watts
+)
+
+
 def format_generation_capacity(watts: int) -> str:
     """
     Format generation capacity with appropriate unit (W, MW, GW, TW, PW).
@@ -30,16 +43,7 @@ def format_generation_capacity(watts: int) -> str:
     Returns:
         Formatted string with appropriate unit (e.g., "1.5 GW", "250 MW")
     """
-    units = [
-        (1_000_000_000_000_000, "PW"),  # Petawatts
-        (1_000_000_000_000, "TW"),      # Terawatts
-        (1_000_000_000, "GW"),          # Gigawatts
-        (1_000_000, "MW"),              # Megawatts
-        (1_000, "kW"),                  # Kilowatts
-        (1, "W"),                       # Watts
-    ]
-
-    for threshold, unit in units:
+    for threshold, unit in _POWER_UNITS:
         if watts >= threshold:
             value = watts / threshold
             # Format with appropriate precision
@@ -53,6 +57,12 @@ def format_generation_capacity(watts: int) -> str:
     return f"{watts} W"
 
 
+# Every possible resource multiplier (2 digits) and combat difficulty (3 digits)
+# field of a seed key, formatted once so decoding is a plain table lookup
+_RESOURCE_MULTIPLIER_NAMES = tuple(resource_multiplier(n) for n in range(100))
+_COMBAT_DIFFICULTY_NAMES = tuple(combat_mode_difficulty_number(n) for n in range(1000))
+
+
 def decode_seed_key(seed_key: int) -> tuple[int, int, str, str]:
     """
     Decode a seed key into its components.
@@ -63,11 +73,10 @@ def decode_seed_key(seed_key: int) -> tuple[int, int, str, str]:
     Returns:
         Tuple of (seed, stars, resource_multiplier, combat_difficulty)
     """
-    seed = seed_key // 100_000_000
-    stars = (seed_key // 100_000) % 1000
-    res_mult = resource_multiplier((seed_key // 1000) % 100)
-    combat = combat_mode_difficulty_number(seed_key % 1000)
-    return seed, stars, res_mult, combat
+    seed, rest = divmod(seed_key, 100_000_000)
+    stars, rest = divmod(rest, 100_000)
+    res_mult, combat = divmod(rest, 1000)
+    return seed, stars, _RESOURCE_MULTIPLIER_NAMES[res_mult], _COMBAT_DIFFICULTY_NAMES[combat]
 
 
 def encode_seed_key(seed: int, stars: int, res_mult_raw: int, combat_raw: int) -> int:
@@ -1,9 +1,13 @@
 #!/usr/bin/env python3
 
 import logging
+import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 
+from config import Config
 from downloader import FullDataDownloader
+from helpers import platform_name
 from statistics_downloader import StatisticsDownloader
 from user_data_downloader import UserDataDownloader
 from cluster_player_downloader import ClusterPlayerDownloader
@@ -140,6 +144,48 @@ def download_cluster_players() -> None:
     print(f"\nSaved to: output/cluster_players.csv")
 
 
+def run_all(platforms: tuple[int, ...] = (0, 1, 2, 3)) -> dict:
+    """
+    Download statistics and all user data for several platforms concurrently.
+
+    Each platform writes to its own <output dir>/<platform name> directory so
+    the concurrent downloads never share an output file.
+
+    Args:
+        platforms: Platform IDs to download (1=Steam, 2=WeGame, 3=XGP, 0=Standalone)
+
+    Returns:
+        Dictionary mapping platform ID to (Summary, list of PlayerData)
+    """
+    output_dir = Config().output_dir
+    configs = {p: Config(output_dir=os.path.join(output_dir, platform_name(p))) for p in platforms}
+
+    # The work is all network latency, so threads overlap it despite the GIL
+    with ThreadPoolExecutor(max_workers=2 * len(platforms)) as executor:
+        futures = {
+            p: (
+                executor.submit(StatisticsDownloader(config=config, platform=p).download_and_parse_statistics),
+                executor.submit(UserDataDownloader(config=config, platform=p).download_and_parse_user_data),
+            )
+            for p, config in configs.items()
+        }
+        return {p: (stats.result(), users.result()) for p, (stats, users) in futures.items()}
+
+
+def download_all_platforms() -> None:
+    """Download statistics and all user data for every platform."""
+    logger = logging.getLogger(__name__)
+
+    results = run_all()
+    logger.info("All platform downloads completed successfully")
+
+    # Print summary
+    print("\n=== DSP Milky Way Data (All Platforms) ===")
+    for p, (summary, players) in results.items():
+        print(f"{platform_name(p)}: {summary.total_players} players, {len(players)} user records")
+    print("\nSaved to: output/<platform>/")
+
+
 def main() -> None:
     """Main entry point for the DSP Milky Way data downloader."""
     setup_logging()
@@ -151,9 +197,10 @@ def main() -> None:
     print("2. Download full data")
     print("3. Download all user data")
     print("4. Download cluster players by seed")
+    print("5. Download statistics and user data for all platforms")
     print("0. Exit")
 
-    choice = input("\nEnter your choice (0-4): ").strip()
+    choice = input("\nEnter your choice (0-5): ").strip()
 
     if choice == "1":
         try:
@@ -179,11 +226,17 @@ def main() -> None:
         except Exception as e:
             logger.error(f"An error occurred: {e}")
             raise
+    elif choice == "5":
+        try:
+            download_all_platforms()
+        except Exception as e:
+            logger.error(f"An error occurred: {e}")
+            raise
     elif choice == "0":
         print("Exiting...")
         sys.exit(0)
     else:
-        print("Invalid choice. Please enter 0-4.")
+        print("Invalid choice. Please enter 0-5.")
         sys.exit(1)
 
 
@@ -3,7 +3,7 @@
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True)
 class PlayerData:
     """Represents a single player's data in the top ten leaderboard."""
 
@@ -18,7 +18,7 @@ class PlayerData:
     is_anonymous: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class SeedData:
     """Represents aggregated data for a specific seed."""
 
@@ -30,7 +30,7 @@ class SeedData:
     total_generation_capacity: str
 
 
-@dataclass
+@dataclass(slots=True)
 class Summary:
     """Represents global summary statistics."""
 
@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 
-import io
 import logging
 from typing import Optional
 
@@ -78,32 +77,31 @@ class StatisticsDownloader:
         - Int32: total players
         - Int32: total dyson spheres
         """
-        with io.BytesIO(data) as stream:
-            r = BinReader(stream)
-
-            # Read header/version (unused in C# code)
-            _ = r.i32()
-
-            # Read statistics data
-            total_gen_cap = r.i64()
-            total_sail_launched = r.i64()
-            total_player = r.i32()
-            total_dyson_sphere = r.i32()
-
-            summary = Summary(
-                total_players=total_player,
-                total_generation_capacity=format_generation_capacity(total_gen_cap * 60),
-                total_sails_launched=total_sail_launched,
-                total_dyson_spheres=total_dyson_sphere,
-            )
-
-            logger.info(
-                f"Statistics: {total_player} players, "
-                f"{total_dyson_sphere} dyson spheres, "
-                f"{total_sail_launched} sails"
-            )
-
-            return summary
+        r = BinReader(data)
+
+        # Read header/version (unused in C# code)
+        _ = r.i32()
+
+        # Read statistics data
+        total_gen_cap = r.i64()
+        total_sail_launched = r.i64()
+        total_player = r.i32()
+        total_dyson_sphere = r.i32()
+
+        summary = Summary(
+            total_players=total_player,
+            total_generation_capacity=format_generation_capacity(total_gen_cap * 60),
+            total_sails_launched=total_sail_launched,
+            total_dyson_spheres=total_dyson_sphere,
+        )
+
+        logger.info(
+            f"Statistics: {total_player} players, "
+            f"{total_dyson_sphere} dyson spheres, "
+            f"{total_sail_launched} sails"
+        )
+
+        return summary
 
     def _save_statistics(self, summary: Summary) -> None:
         """
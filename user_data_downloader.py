@@ -1,18 +1,28 @@
 #!/usr/bin/env python3
 
-import io
+import contextlib
 import csv
 import logging
-from typing import Optional
+import mmap
+import os
+import struct
+from typing import Optional, Union
 
 from binary_reader import BinReader
 from config import Config
 from helpers import platform_name, decode_seed_key, format_generation_capacity
 from models import PlayerData
-from utils import generate_random_steam_user_id, http_get
+from utils import generate_random_steam_user_id, http_get_to_file
 
 logger = logging.getLogger(__name__)
 
+# File header: version (Int32), player record count (Int32)
+_HDR = struct.Struct("<ii")
+# Fixed-width parts of a player record around the variable-length name:
+# seedKey (Int64), userId (Int64), platform (Byte) / genCap (Int64), isAnon (Byte)
+_PREFIX = struct.Struct("<qqB")
+_SUFFIX = struct.Struct("<qB")
+
 
 class UserDataDownloader:
     """Handles downloading and parsing DSP Milky Way user data."""
@@ -45,12 +55,19 @@ class UserDataDownloader:
             url = self.config.get_all_user_data_url(self.user_id, self.platform)
             logger.info(f"Fetching user data from: {url}")
 
-            # Download the raw binary data
-            data = http_get(url)
-            logger.info(f"Downloaded {len(data)} bytes of user data")
-
-            # Parse the binary data
-            players = self._parse_user_data(data)
+            # Stream the raw binary data to disk and parse it through a
+            # read-only mapping instead of holding the whole body in memory
+            self.config.ensure_output_dir()
+            bin_path = self.config.user_data_bin
+            try:
+                http_get_to_file(url, bin_path)
+                logger.info(f"Downloaded {os.path.getsize(bin_path)} bytes of user data")
+                with open(bin_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+                    players = self._parse_user_data(data)
+            finally:
+                # Also removes a partial download if fetching failed
+                with contextlib.suppress(FileNotFoundError):
+                    os.remove(bin_path)
             logger.info(f"Successfully parsed {len(players)} player records")
 
             # Save to CSV file
@@ -63,12 +80,12 @@ class UserDataDownloader:
             logger.error(f"Failed to download and parse user data: {e}")
             raise RuntimeError(f"Failed to download and parse user data: {e}") from e
 
-    def _parse_user_data(self, data: bytes) -> list[PlayerData]:
+    def _parse_user_data(self, data: Union[bytes, mmap.mmap]) -> list[PlayerData]:
         """
         Parse the binary user data.
 
         Args:
-            data: Raw binary data from the server
+            data: Raw binary data from the server, in memory or mapped from disk
 
         Returns:
             List of PlayerData objects
@@ -85,46 +102,48 @@ class UserDataDownloader:
             - Byte: isAnon
         """
         players = []
-
-        with io.BytesIO(data) as stream:
-            r = BinReader(stream)
-
-            # Read header/version (unused)
-            header = r.i32()
-            logger.info(f"Header/Version: {header}")
-
-            # Read number of players
-            num_players = r.i32()
-            logger.info(f"Parsing {num_players} player records")
-
-            for _ in range(num_players):
-                seed_key = r.i64()
-                user_id = r.i64()
-                platform = r.u8()
-
-                # ReadString in C# BinaryReader: reads 7-bit encoded length, then UTF-8 bytes
-                name_len = r.read7bit_encoded_int()
-                name_bytes = r.read(name_len)
-                name = name_bytes.decode("utf-8", errors="replace")
-
-                gen_cap = r.i64()
-                is_anon = r.u8()
-
-                # Decode seed key
-                seed, stars, res_mult, combat = decode_seed_key(seed_key)
-
-                player = PlayerData(
-                    seed=seed,
-                    stars=stars,
-                    resource_multiplier=res_mult,
-                    combat_difficulty=combat,
-                    user_id=user_id,
-                    platform=platform_name(platform),
-                    account_name=name,
-                    generation_capacity=format_generation_capacity(gen_cap * 60),
-                    is_anonymous=is_anon > 0,
-                )
-                players.append(player)
+        append = players.append
+
+        # Released on exit, even on error, so a mapped file can be closed
+        with memoryview(data) as mv:
+            try:
+                # Read header/version (unused) and number of players
+                header, num_players = _HDR.unpack_from(mv, 0)
+                off = _HDR.size
+                logger.info(f"Header/Version: {header}")
+                logger.info(f"Parsing {num_players} player records")
+
+                for _ in range(num_players):
+                    seed_key, user_id, platform = _PREFIX.unpack_from(mv, off)
+                    off += _PREFIX.size
+
+                    # ReadString in C# BinaryReader: reads 7-bit encoded length, then UTF-8 bytes
+                    name_len, off = BinReader.read7bit_from_mv(mv, off)
+                    if off + name_len > len(mv):
+                        raise EOFError("unexpected EOF")
+                    name = bytes(mv[off:off + name_len]).decode("utf-8", errors="replace")
+                    off += name_len
+
+                    gen_cap, is_anon = _SUFFIX.unpack_from(mv, off)
+                    off += _SUFFIX.size
+
+                    # Decode seed key
+                    seed, stars, res_mult, combat = decode_seed_key(seed_key)
+
+                    append(PlayerData(
+                        seed=seed,
+                        stars=stars,
+                        resource_multiplier=res_mult,
+                        combat_difficulty=combat,
+                        user_id=user_id,
+                        platform=platform_name(platform),
+                        account_name=name,
+                        generation_capacity=format_generation_capacity(gen_cap * 60),
+                        is_anonymous=is_anon > 0,
+                    ))
+            except (struct.error, IndexError):
+                # Truncated input: report it like BinReader does
+                raise EOFError("unexpected EOF") from None
 
         return players
 
@@ -137,25 +156,25 @@ class UserDataDownloader:
         """
         self.config.ensure_output_dir()
 
-        with open(self.config.user_data_csv, "w", newline="", encoding="utf-8") as f:
+        with open(self.config.user_data_csv, "w", newline="", encoding="utf-8", buffering=1 << 20) as f:
             w = csv.writer(f)
             # Write header with Chinese labels
             w.writerow(
                 ["种子", "星数", "资源倍率", "战斗难度", "用户ID", "平台", "账号", "发电量", "匿名"]
             )
 
-            # Write player data
-            for player in players:
-                w.writerow(
-                    [
-                        str(player.seed),
-                        str(player.stars),
-                        player.resource_multiplier,
-                        player.combat_difficulty,
-                        str(player.user_id),
-                        player.platform,
-                        player.account_name,
-                        player.generation_capacity,
-                        str(player.is_anonymous),
-                    ]
+            # Write player data; csv stringifies the int and bool fields itself
+            w.writerows(
+                (
+                    player.seed,
+                    player.stars,
+                    player.resource_multiplier,
+                    player.combat_difficulty,
+                    player.user_id,
+                    player.platform,
+                    player.account_name,
+                    player.generation_capacity,
+                    player.is_anonymous,
                 )
+                for player in players
+            )
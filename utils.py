@@ -1,12 +1,32 @@
 #!/usr/bin/env python3
 
 import random
+import threading
+import time
+
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 SERVER_ADDRESS = "http://8.140.162.132/"
 LOGIN_HEADER_API = "login/header"
 DOWNLOAD_FULL_DATA_API = "download"
 
+# Fixed bits of a Steam user ID (individual account in the public universe);
+# the 31-bit account number is filled in above the lowest bit
+_STEAM_USER_ID_BASE = 1 | (1 << 32) | (1 << 52) | (1 << 56)
+
+# (connect, read) timeouts in seconds for every request
+_TIMEOUT = (3.05, 30)
+
+# Shared by every request so they reuse pooled keep-alive connections. The
+# pool keeps up to 16 connections per host for callers that download from
+# several threads, and failed connections are retried with backoff.
+_SESSION = requests.Session()
+_ADAPTER = HTTPAdapter(pool_connections=16, pool_maxsize=16, max_retries=Retry(total=3, backoff_factor=0.3))
+_SESSION.mount("http://", _ADAPTER)
+_SESSION.mount("https://", _ADAPTER)
+
 
 def generate_random_steam_user_id() -> int:
     """
@@ -15,7 +35,31 @@ def generate_random_steam_user_id() -> int:
     Returns:
         A valid Steam user ID with proper bit flags set
     """
-    return 1 | (1 << 32) | (1 << 52) | (1 << 56) | ((random.getrandbits(31)) << 1)
+    return _STEAM_USER_ID_BASE | (random.getrandbits(31) << 1)
+
+
+class RateLimiter:
+    """Spaces out calls shared across threads to at most one per interval."""
+
+    def __init__(self, interval: float):
+        """
+        Initialize the rate limiter.
+
+        Args:
+            interval: Minimum number of seconds between two calls to wait()
+        """
+        self.interval = interval
+        self._lock = threading.Lock()
+        self._next_allowed = 0.0
+
+    def wait(self) -> None:
+        """Block until the next call is allowed, reserving that slot for the caller."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            self._next_allowed = start + self.interval
+        if start > now:
+            time.sleep(start - now)
 
 
 def http_get(url: str) -> bytes:
@@ -31,11 +75,29 @@ def http_get(url: str) -> bytes:
     Raises:
         requests.HTTPError: If the request fails
     """
-    response = requests.get(url)
+    response = _SESSION.get(url, timeout=_TIMEOUT)
     response.raise_for_status()
     return response.content
 
 
+def http_get_to_file(url: str, path: str) -> None:
+    """
+    Perform an HTTP GET request and stream the response body to a file.
+
+    Args:
+        url: The URL to fetch
+        path: Destination file path
+
+    Raises:
+        requests.HTTPError: If the request fails
+    """
+    with _SESSION.get(url, stream=True, timeout=_TIMEOUT) as response:
+        response.raise_for_status()
+        with open(path, "wb") as f:
+            for chunk in response.iter_content(chunk_size=1 << 20):
+                f.write(chunk)
+
+
 def login(user_id: int) -> str:
     """
     Log in to the server with the given user ID and return the response data.
@@ -53,17 +115,15 @@ def login(user_id: int) -> str:
     return response.decode("utf-8")
 
 
-def fetch_full_data(full_data_url: str) -> bytes:
+def fetch_full_data_to_file(full_data_url: str, path: str) -> None:
     """
-    Fetch the full data from the given URL.
+    Fetch the full data from the given URL and save it to a file.
 
     Args:
         full_data_url: The URL path to fetch the full data from
-
-    Returns:
-        The full data content as bytes
+        path: Destination file path for the (still compressed) data
 
     Raises:
         requests.HTTPError: If the request fails
     """
-    return http_get(f"{SERVER_ADDRESS}{DOWNLOAD_FULL_DATA_API}/{full_data_url}")
\ No newline at end of file
+    http_get_to_file(f"{SERVER_ADDRESS}{DOWNLOAD_FULL_DATA_API}/{full_data_url}", path)